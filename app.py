@@ -1,38 +1,34 @@
+import os
+
 from flask import Flask, request, jsonify, send_from_directory, render_template
 from flask_cors import CORS
-from study_planner import StudyPlanner  # Import the StudyPlanner class we created earlier
+from catalog import build_catalog
+from progress_store import ProgressStore
 
 app = Flask(__name__, static_folder="static", static_url_path="")
 CORS(app, resources={r"/api/*": {"origins": "*"}})  # More specific CORS configuration
 CORS(app)  # Allow cross-origin requests
 
+# Settings for multi-process deployments (see run_workers.py)
+CATALOG_READ_ONLY = os.environ.get('PLANNER_CATALOG_READ_ONLY') == '1'
+PROGRESS_DB_PATH = os.environ.get('PLANNER_PROGRESS_DB')
+
 # Initialize our planner with some example data
-planner = StudyPlanner()
-
-# Add concepts with difficulty and prerequisites
-planner.add_concept("Arrays", 2)
-planner.add_concept("Strings", 2)
-planner.add_concept("Hash Tables", 3, ["Arrays"])
-planner.add_concept("Linked Lists", 3)
-planner.add_concept("Stacks & Queues", 4, ["Arrays", "Linked Lists"])
-planner.add_concept("Trees", 5, ["Linked Lists"])
-planner.add_concept("Graphs", 7, ["Trees"])
-planner.add_concept("Dynamic Programming", 8, ["Arrays", "Recursion"])
-planner.add_concept("Recursion", 5)
-planner.add_concept("Sorting", 4, ["Arrays"])
-planner.add_concept("Binary Search", 4, ["Arrays", "Sorting"])
-
-# Add problems for each concept
-planner.add_problem("p1", "Arrays", 1, "Two Sum")
-planner.add_problem("p2", "Arrays", 2, "Container With Most Water")
-planner.add_problem("p3", "Arrays", 3, "Merge Intervals")
-planner.add_problem("p4", "Strings", 1, "Valid Anagram")
-planner.add_problem("p5", "Strings", 2, "Longest Palindromic Substring")
-planner.add_problem("p6", "Hash Tables", 2, "Group Anagrams")
-planner.add_problem("p7", "Hash Tables", 3, "LRU Cache")
-planner.add_problem("p8", "Linked Lists", 2, "Reverse Linked List")
-planner.add_problem("p9", "Recursion", 3, "Generate Parentheses")
-planner.add_problem("p10", "Dynamic Programming", 4, "Climbing Stairs")
+planner = build_catalog()
+planner.freeze()
+
+# Progress lives in the shared store when configured, otherwise on the planner
+progress_store = ProgressStore(PROGRESS_DB_PATH) if PROGRESS_DB_PATH else None
+
+def current_user():
+    """Get the user whose progress this request reads or updates."""
+    return request.args.get('user', 'default')
+
+def get_planner():
+    """Get a planner reflecting the current user's progress."""
+    if progress_store is None:
+        return planner
+    return planner.with_progress(progress_store.completed_problems(current_user()))
 
 @app.route('/')
 def index():
@@ -40,6 +36,7 @@ def index():
 
 @app.route('/api/concepts', methods=['GET'])
 def get_concepts():
+    planner = get_planner()
     concepts = []
     for concept, difficulty in planner.concept_difficulty.items():
         concepts.append({
@@ -53,6 +50,7 @@ def get_concepts():
 
 @app.route('/api/problems', methods=['GET'])
 def get_problems():
+    planner = get_planner()
     problems = []
     for concept, concept_problems in planner.concept_problems.items():
         for problem in concept_problems:
@@ -67,28 +65,33 @@ def get_problems():
 
 @app.route('/api/available-concepts', methods=['GET'])
 def get_available_concepts():
+    planner = get_planner()
     available = planner.get_available_concepts()
     return jsonify(available)
 
 @app.route('/api/recommended-concepts', methods=['GET'])
 def get_recommended_concepts():
+    planner = get_planner()
     limit = request.args.get('limit', 3, type=int)
     recommended = planner.get_next_recommended_concepts(limit=limit)
     return jsonify(recommended)
 
 @app.route('/api/recommended-problems', methods=['GET'])
 def get_recommended_problems():
+    planner = get_planner()
     limit = request.args.get('limit', 5, type=int)
     recommended = planner.get_recommended_problems(limit=limit)
     return jsonify(recommended)
 
 @app.route('/api/learning-path', methods=['GET'])
 def get_learning_path():
+    planner = get_planner()
     path = planner.get_learning_path()
     return jsonify(path)
 
 @app.route('/api/study-plan', methods=['GET'])
 def get_study_plan():
+    planner = get_planner()
     days = request.args.get('days', 10, type=int)
     plan = planner.generate_study_plan(days=days)
     return jsonify(plan)
@@ -100,11 +103,15 @@ def complete_problem():
     if not problem_id:
         return jsonify({'error': 'Problem ID is required'}), 400
     
-    planner.mark_problem_completed(problem_id)
+    if progress_store is not None:
+        progress_store.mark_problem_completed(current_user(), problem_id)
+    else:
+        planner.mark_problem_completed(problem_id)
     return jsonify({'success': True})
 
 @app.route('/api/concept-graph', methods=['GET'])
 def get_concept_graph():
+    planner = get_planner()
     nodes = []
     links = []
     
@@ -129,6 +136,9 @@ def get_concept_graph():
 
 @app.route('/api/add-concept', methods=['POST'])
 def add_concept():
+    if CATALOG_READ_ONLY:
+        return jsonify({'error': 'Catalog is read-only when shared between workers'}), 409
+    
     data = request.json
     concept_name = data.get('name')
     difficulty = data.get('difficulty')
@@ -138,10 +148,14 @@ def add_concept():
         return jsonify({'error': 'Name and difficulty are required'}), 400
     
     planner.add_concept(concept_name, difficulty, prerequisites)
+    planner.freeze()
     return jsonify({'success': True})
 
 @app.route('/api/add-problem', methods=['POST'])
 def add_problem():
+    if CATALOG_READ_ONLY:
+        return jsonify({'error': 'Catalog is read-only when shared between workers'}), 409
+    
     data = request.json
     problem_id = data.get('id')
     concept = data.get('concept')
@@ -152,6 +166,7 @@ def add_problem():
         return jsonify({'error': 'ID, concept, and difficulty are required'}), 400
     
     planner.add_problem(problem_id, concept, difficulty, name)
+    planner.freeze()
     return jsonify({'success': True})
 
 if __name__ == '__main__':
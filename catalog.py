@@ -0,0 +1,33 @@
+from study_planner import StudyPlanner
+
+
+def build_catalog():
+    """Build a planner loaded with the example concepts and problems."""
+    planner = StudyPlanner()
+
+    # Add concepts with difficulty and prerequisites
+    planner.add_concept("Arrays", 2)
+    planner.add_concept("Strings", 2)
+    planner.add_concept("Hash Tables", 3, ["Arrays"])
+    planner.add_concept("Linked Lists", 3)
+    planner.add_concept("Stacks & Queues", 4, ["Arrays", "Linked Lists"])
+    planner.add_concept("Trees", 5, ["Linked Lists"])
+    planner.add_concept("Graphs", 7, ["Trees"])
+    planner.add_concept("Dynamic Programming", 8, ["Arrays", "Recursion"])
+    planner.add_concept("Recursion", 5)
+    planner.add_concept("Sorting", 4, ["Arrays"])
+    planner.add_concept("Binary Search", 4, ["Arrays", "Sorting"])
+
+    # Add problems for each concept
+    planner.add_problem("p1", "Arrays", 1, "Two Sum")
+    planner.add_problem("p2", "Arrays", 2, "Container With Most Water")
+    planner.add_problem("p3", "Arrays", 3, "Merge Intervals")
+    planner.add_problem("p4", "Strings", 1, "Valid Anagram")
+    planner.add_problem("p5", "Strings", 2, "Longest Palindromic Substring")
+    planner.add_problem("p6", "Hash Tables", 2, "Group Anagrams")
+    planner.add_problem("p7", "Hash Tables", 3, "LRU Cache")
+    planner.add_problem("p8", "Linked Lists", 2, "Reverse Linked List")
+    planner.add_problem("p9", "Recursion", 3, "Generate Parentheses")
+    planner.add_problem("p10", "Dynamic Programming", 4, "Climbing Stairs")
+
+    return planner
@@ -0,0 +1,41 @@
+import sqlite3
+from contextlib import closing
+
+
+class ProgressStore:
+    """Per-user progress kept in a local SQLite file shared by all workers."""
+
+    def __init__(self, path):
+        self.path = path
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS completed_problems ('
+                'user_id TEXT NOT NULL, '
+                'problem_id TEXT NOT NULL, '
+                'PRIMARY KEY (user_id, problem_id))'
+            )
+
+    def _connect(self):
+        # Each call opens and closes its own connection: the threaded server
+        # starts a thread per request, so there is no thread to cache one on,
+        # and forked workers must never inherit an open connection
+        return sqlite3.connect(self.path, timeout=30)
+
+    def completed_problems(self, user_id):
+        """Get the set of problem IDs the user has completed."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                'SELECT problem_id FROM completed_problems WHERE user_id = ?',
+                (user_id,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark_problem_completed(self, user_id, problem_id):
+        """Record a completed problem for the user."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                'INSERT OR IGNORE INTO completed_problems (user_id, problem_id) VALUES (?, ?)',
+                (user_id, problem_id)
+            )
@@ -0,0 +1,96 @@
+"""Serve app.py from several worker processes that share one catalog.
+
+The parent builds the catalog once by importing app.py, then forks the
+workers so they inherit it copy-on-write instead of each building their
+own. Per-user progress lives in a common SQLite file and every worker
+accepts connections from the same listening socket.
+"""
+import argparse
+import gc
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import socket
+import sys
+import time
+
+
+def address_family(host):
+    """Pick the socket family for host the same way werkzeug does."""
+    if ':' in host and hasattr(socket, 'AF_INET6'):
+        return socket.AF_INET6
+    return socket.AF_INET
+
+
+def serve(host, port, fd):
+    # Workers are stopped by the parent, not by the terminal or its handler
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    from werkzeug.serving import make_server
+    from app import app
+
+    make_server(host, port, app, threaded=True, fd=fd).serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--progress-db', default='planner_progress.db')
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+
+    os.environ['PLANNER_CATALOG_READ_ONLY'] = '1'
+    os.environ['PLANNER_PROGRESS_DB'] = os.path.abspath(args.progress_db)
+
+    # Build the catalog in the parent so forked workers share its pages, and
+    # keep the garbage collector from touching them after the fork
+    import app  # noqa: F401
+    gc.freeze()
+
+    sock = socket.create_server(
+        (args.host, args.port), family=address_family(args.host), backlog=128
+    )
+
+    context = multiprocessing.get_context('fork')
+
+    def spawn():
+        worker = context.Process(target=serve, args=(args.host, args.port, sock.fileno()))
+        worker.start()
+        return worker
+
+    def stop(signum, frame):
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+
+    workers = [spawn() for _ in range(args.workers)]
+    print(f"Serving on http://{args.host}:{args.port} with {args.workers} workers")
+    try:
+        while True:
+            multiprocessing.connection.wait([worker.sentinel for worker in workers])
+            for i, worker in enumerate(workers):
+                if not worker.is_alive():
+                    print(
+                        f"Worker {worker.pid} exited with code {worker.exitcode}, restarting",
+                        file=sys.stderr
+                    )
+                    # Back off so a worker that fails at startup cannot spin
+                    time.sleep(1)
+                    workers[i] = spawn()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.join()
+        sock.close()
+
+
+if __name__ == '__main__':
+    main()
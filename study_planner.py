@@ -40,7 +40,37 @@ class StudyPlanner:
             'concept': concept,
             'name': name or problem_id
         })
-    
+
+    def freeze(self):
+        """Create every per-concept lookup key up front.
+
+        Read-only methods index these defaultdicts by concept, which inserts
+        missing keys. Call this before sharing the catalog between threads
+        via with_progress() so concurrent reads never resize the dictionaries.
+        """
+        for concept in self.concept_difficulty:
+            self.reverse_dependencies.setdefault(concept, [])
+            self.concept_problems.setdefault(concept, [])
+
+    def with_progress(self, completed_problems):
+        """Return a planner sharing this catalog with the given progress applied.
+
+        The catalog structures are shared by reference, so the returned planner
+        is cheap to create per request but must not be used to add concepts
+        or problems. Call freeze() before sharing the catalog between threads.
+        """
+        planner = StudyPlanner()
+        planner.concept_dependencies = self.concept_dependencies
+        planner.reverse_dependencies = self.reverse_dependencies
+        planner.concept_difficulty = self.concept_difficulty
+        planner.concept_problems = self.concept_problems
+
+        planner.completed_problems = set(completed_problems)
+        for concept, problems in self.concept_problems.items():
+            if any(p['id'] in planner.completed_problems for p in problems):
+                planner._update_concept_progress(concept)
+        return planner
+
     def mark_problem_completed(self, problem_id):
         """Mark a problem as completed and update concept proficiency."""
         self.completed_problems.add(problem_id)
@@ -49,14 +79,18 @@ class StudyPlanner:
         for concept, problems in self.concept_problems.items():
             for problem in problems:
                 if problem['id'] == problem_id:
-                    # Update proficiency for this concept
-                    completed_count = sum(1 for p in problems if p['id'] in self.completed_problems)
-                    self.concept_proficiency[concept] = completed_count / len(problems)
-                    
-                    # If proficiency is high enough, mark concept as completed
-                    if self.concept_proficiency[concept] >= 0.8:
-                        self.completed_concepts.add(concept)
+                    self._update_concept_progress(concept)
                     return
+
+    def _update_concept_progress(self, concept):
+        """Recompute proficiency for a concept from its completed problems."""
+        problems = self.concept_problems[concept]
+        completed_count = sum(1 for p in problems if p['id'] in self.completed_problems)
+        self.concept_proficiency[concept] = completed_count / len(problems)
+        
+        # If proficiency is high enough, mark concept as completed
+        if self.concept_proficiency[concept] >= 0.8:
+            self.completed_concepts.add(concept)
     
     def get_available_concepts(self):
         """Get concepts that can be studied now (all prerequisites satisfied)."""
@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip('flask')
+pytest.importorskip('flask_cors')
+
+import app as app_module
+from progress_store import ProgressStore
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def shared_mode(monkeypatch, tmp_path):
+    monkeypatch.setattr(app_module, 'CATALOG_READ_ONLY', True)
+    monkeypatch.setattr(app_module, 'progress_store', ProgressStore(str(tmp_path / 'progress.db')))
+
+
+def test_catalog_is_read_only_in_shared_mode(client, shared_mode):
+    response = client.post('/api/add-concept', json={'name': 'Heaps', 'difficulty': 5})
+    assert response.status_code == 409
+
+    response = client.post('/api/add-problem', json={'id': 'p11', 'concept': 'Arrays', 'difficulty': 1})
+    assert response.status_code == 409
+
+
+def test_progress_is_tracked_per_user_in_shared_mode(client, shared_mode):
+    response = client.post('/api/complete-problem?user=alice', json={'problemId': 'p1'})
+    assert response.status_code == 200
+
+    def completed(user):
+        problems = client.get(f'/api/problems?user={user}').get_json()
+        return {p['id'] for p in problems if p['completed']}
+
+    assert completed('alice') == {'p1'}
+    assert completed('bob') == set()
+    assert app_module.planner.completed_problems == set()
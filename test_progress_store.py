@@ -0,0 +1,26 @@
+from progress_store import ProgressStore
+
+
+def test_progress_is_isolated_per_user(tmp_path):
+    store = ProgressStore(str(tmp_path / 'progress.db'))
+    store.mark_problem_completed('alice', 'p1')
+    store.mark_problem_completed('bob', 'p2')
+
+    assert store.completed_problems('alice') == {'p1'}
+    assert store.completed_problems('bob') == {'p2'}
+    assert store.completed_problems('carol') == set()
+
+
+def test_duplicate_completions_are_ignored(tmp_path):
+    store = ProgressStore(str(tmp_path / 'progress.db'))
+    store.mark_problem_completed('alice', 'p1')
+    store.mark_problem_completed('alice', 'p1')
+
+    assert store.completed_problems('alice') == {'p1'}
+
+
+def test_progress_is_shared_between_store_instances(tmp_path):
+    path = str(tmp_path / 'progress.db')
+    ProgressStore(path).mark_problem_completed('alice', 'p1')
+
+    assert ProgressStore(path).completed_problems('alice') == {'p1'}
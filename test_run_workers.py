@@ -0,0 +1,19 @@
+import socket
+
+import pytest
+
+import run_workers
+
+
+@pytest.mark.parametrize('workers', ['0', '-1'])
+def test_workers_below_one_are_rejected(monkeypatch, workers):
+    monkeypatch.setattr('sys.argv', ['run_workers.py', '--workers', workers])
+
+    with pytest.raises(SystemExit) as excinfo:
+        run_workers.main()
+    assert excinfo.value.code == 2
+
+
+def test_address_family_follows_host():
+    assert run_workers.address_family('127.0.0.1') == socket.AF_INET
+    assert run_workers.address_family('::') == socket.AF_INET6
@@ -0,0 +1,40 @@
+from catalog import build_catalog
+
+
+def test_with_progress_matches_marking_problems_one_at_a_time():
+    completed = ['p1', 'p2', 'p3', 'p6', 'p9', 'unknown']
+    marked = build_catalog()
+    for problem_id in completed:
+        marked.mark_problem_completed(problem_id)
+
+    catalog = build_catalog()
+    catalog.freeze()
+    view = catalog.with_progress(completed)
+
+    assert view.completed_problems == marked.completed_problems
+    assert view.completed_concepts == marked.completed_concepts
+    assert {c: p for c, p in view.concept_proficiency.items() if p} == \
+        {c: p for c, p in marked.concept_proficiency.items() if p}
+    assert view.get_recommended_problems() == marked.get_recommended_problems()
+    assert view.generate_study_plan(days=5) == marked.generate_study_plan(days=5)
+
+
+def test_with_progress_leaves_catalog_progress_untouched():
+    catalog = build_catalog()
+    catalog.freeze()
+    catalog.with_progress(['p1', 'p2', 'p3'])
+
+    assert catalog.completed_problems == set()
+    assert catalog.completed_concepts == set()
+
+
+def test_freeze_stops_reads_from_growing_shared_dicts():
+    catalog = build_catalog()
+    catalog.freeze()
+    sizes = (len(catalog.concept_problems), len(catalog.reverse_dependencies))
+
+    view = catalog.with_progress([])
+    view.get_recommended_problems(limit=20)
+    view.generate_study_plan(days=3)
+
+    assert (len(catalog.concept_problems), len(catalog.reverse_dependencies)) == sizes